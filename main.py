@@ -1,30 +1,105 @@
 import os
-import io
+import asyncio
+import tempfile
+import orjson
+from functools import lru_cache
 from bson import ObjectId
-from datetime import datetime
+from bson.errors import InvalidId
+import time
 from typing import Optional
 from dotenv import load_dotenv
 
 # API Framework Imports
-from fastapi import FastAPI, File, UploadFile, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi import FastAPI, File, Request, Response, UploadFile, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
-import motor.motor_asyncio
+from pymongo import AsyncMongoClient
+from gridfs import AsyncGridFSBucket
 from fastapi.responses import RedirectResponse
 
 
 # CONFIGURATION 
 # Load environment variables (MONGO_URI) from the .env file for security
 load_dotenv()
-app = FastAPI()
+# ORJSONResponse serializes responses with the C-backed orjson library instead
+# of the stdlib json module, which is much faster for the dict-heavy endpoints
+app = FastAPI(default_response_class=ORJSONResponse)
+
+# The JSON list responses are dominated by repeated field names, which gzip
+# shrinks dramatically. Media bodies are already compressed binary, so those
+# paths bypass the middleware instead of burning CPU for no size gain
+MEDIA_PATH_PREFIXES = ("/get_poster/", "/get_promo_video/", "/get_venue_photo/")
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(MEDIA_PATH_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024, compresslevel=5)
 
 async def root():
     # This automatically sends anyone who visits the home page to the /docs page
     return RedirectResponse(url="/docs")
-# Initialize MongoDB Client using the Motor async driver
+# Initialize MongoDB Client using PyMongo's native asyncio driver - unlike
+# Motor it talks to the event loop directly instead of hopping through a
+# thread pool for every operation
+# The pool is tuned explicitly: minPoolSize keeps warm connections ready so the
+# first requests after boot don't pay the TCP/TLS handshake, and maxPoolSize
+# caps how many sockets a burst of traffic can open
 MONGO_URI = os.getenv("MONGO_URI")
-client = motor.motor_asyncio.AsyncIOMotorClient(MONGO_URI)
-db = client.event_management_db 
+client = AsyncMongoClient(
+    MONGO_URI,
+    maxPoolSize=50,
+    minPoolSize=10,
+    maxIdleTimeMS=30000,
+    serverSelectionTimeoutMS=3000,
+    connectTimeoutMS=3000,
+)
+db = client.event_management_db
+
+# GridFS buckets for the multimedia endpoints - files are stored and
+# transferred in chunks instead of as single (16 MB limited) BSON documents
+poster_fs = AsyncGridFSBucket(db, bucket_name="event_posters")
+video_fs = AsyncGridFSBucket(db, bucket_name="promo_videos")
+photo_fs = AsyncGridFSBucket(db, bucket_name="venue_photos")
+
+
+@app.on_event("startup")
+async def warm_up_connection_pool():
+    """Pings the database at startup so the connection pool is established
+    before the first request arrives"""
+    await client.admin.command("ping")
+
+
+@app.on_event("startup")
+async def create_indexes():
+    """Declares the indexes backing the find_one lookups in the media endpoints
+    and the booking queries, so they are index seeks rather than collection
+    scans. Mongo builds them online and the calls are no-ops once they exist"""
+    await db["event_posters.files"].create_index("metadata.event_id")
+    await db["promo_videos.files"].create_index("metadata.event_id")
+    await db["venue_photos.files"].create_index("metadata.venue_id")
+    await db.bookings.create_index([("event_id", 1), ("attendee_id", 1)])
+
+
+@app.on_event("startup")
+async def warm_up_hot_paths():
+    """Validates one sample document per model and runs a one-document query,
+    so the first real request doesn't pay for Pydantic validator compilation
+    or the driver's cold query path"""
+    samples = {
+        Event: {"name": "x", "description": "x", "date": "x",
+                "venue_id": "x", "max_attendees": 1},
+        Attendee: {"name": "x", "email": "x"},
+        Venue: {"name": "x", "address": "x", "capacity": 1},
+        Booking: {"event_id": "x", "attendee_id": "x", "ticket_type": "x", "quantity": 1},
+    }
+    for model, sample in samples.items():
+        model(**sample).model_dump()
+    await db.events.find().limit(1).to_list(1)
 
 # DATA MODELS
 # These models define the structure of the data and provide automatic validation
@@ -51,6 +126,169 @@ class Booking(BaseModel):
     ticket_type: str
     quantity: int
 
+# HELPERS
+
+def _build_encoder(model):
+    """Generates a specialized document encoder for one model. The generated
+    function is a single dict display with every field access inlined, which
+    beats mutating a generic dict in a loop when serializing many documents"""
+    parts = ['"_id": str(d["_id"])']
+    parts += [f'"{name}": d.get("{name}")' for name in model.model_fields]
+    src = f"def enc(d): return {{{', '.join(parts)}}}"
+    namespace = {}
+    exec(src, namespace)
+    return namespace["enc"]
+
+
+encode_event = _build_encoder(Event)
+encode_attendee = _build_encoder(Attendee)
+encode_venue = _build_encoder(Venue)
+encode_booking = _build_encoder(Booking)
+
+
+@lru_cache(maxsize=1024)
+def oid(value: str) -> ObjectId:
+    """Converts a path parameter into an ObjectId, answering 400 instead of an
+    unhandled 500 when the ID is malformed. Cached because the hot CRUD paths
+    tend to hit the same handful of documents repeatedly"""
+    try:
+        return ObjectId(value)
+    except InvalidId:
+        raise HTTPException(status_code=400, detail="Invalid ID format")
+
+
+def stream_docs(cursor):
+    """Streams documents from an async cursor as a JSON array, one document at a
+    time, so the full result set is never held in memory"""
+    async def gen():
+        yield b"["
+        first = True
+        async for doc in cursor:
+            yield (b"" if first else b",") + orjson.dumps(doc)
+            first = False
+        yield b"]"
+    return StreamingResponse(gen(), media_type="application/json")
+
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+
+async def stream_upload(fs, file, metadata):
+    """Copies an UploadFile into a GridFS bucket in 1 MB chunks, so only one
+    chunk is ever held in memory no matter how large the file is.
+    Large uploads spill from Starlette's in-memory spool to a disk-backed temp
+    file; in that case the raw file object is handed straight to the driver,
+    which reads it chunk by chunk itself and skips the extra hop through
+    UploadFile's async wrapper on every chunk"""
+    grid_in = fs.open_upload_stream(file.filename, metadata=metadata)
+    raw = file.file
+    if isinstance(raw, tempfile.SpooledTemporaryFile) and raw._rolled:
+        raw.seek(0)
+        await grid_in.write(raw)
+    else:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await grid_in.write(chunk)
+    await grid_in.close()
+    return grid_in._id
+
+
+# Below this size a file fits comfortably in memory and a plain Response costs
+# one ASGI send instead of one per chunk, which matters at high QPS for
+# thumbnails; anything bigger (videos) still streams chunk by chunk
+SMALL_FILE_THRESHOLD = 2_000_000  # bytes
+
+
+async def stream_download(fs, files, query, request):
+    """Looks up a GridFS file and sends it back - small files as a single
+    direct Response, large ones streamed chunk by chunk so memory stays
+    constant regardless of file size.
+    Files are immutable once uploaded, so their _id doubles as a strong ETag:
+    when the client sends a matching If-None-Match we answer 304 without
+    touching the chunks at all. Returns None when no file matches"""
+    doc = await files.find_one(query, {"_id": 1, "length": 1})
+    if not doc:
+        return None
+    etag = f'"{doc["_id"]}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=86400"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    grid_out = await fs.open_download_stream(doc["_id"])
+    media_type = grid_out.metadata["content_type"]
+
+    if doc["length"] < SMALL_FILE_THRESHOLD:
+        return Response(content=await grid_out.read(), media_type=media_type,
+                        headers=headers)
+
+    async def streamer():
+        while chunk := await grid_out.readchunk():
+            yield chunk
+
+    return StreamingResponse(streamer(), media_type=media_type, headers=headers)
+
+
+async def head_file(files, query):
+    """Builds a headers-only response for a GridFS file (size, type, ETag) so
+    clients can validate their cache without transferring the body.
+    Returns None when no file matches"""
+    doc = await files.find_one(query, {"length": 1, "metadata.content_type": 1})
+    if not doc:
+        return None
+    return Response(headers={
+        "Content-Length": str(doc["length"]),
+        "Content-Type": doc["metadata"]["content_type"],
+        "ETag": f'"{doc["_id"]}"',
+        "Cache-Control": "public, max-age=86400",
+    })
+
+class InsertBatcher:
+    """Coalesces single-document inserts into insert_many batches.
+    Handlers enqueue their document and await a future; a background flusher
+    drains the queue as soon as a document arrives, waits up to 10 ms for more
+    (max 100 per batch) and writes them all in one round trip, amortizing the
+    network and journal fsync cost across the batch"""
+
+    MAX_BATCH = 100
+    FLUSH_WINDOW = 0.01  # seconds to wait for more documents after the first
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.queue = asyncio.Queue()
+
+    async def insert(self, doc):
+        """Queues a document and returns its _id once the batch is written"""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((doc, future))
+        return await future
+
+    async def run(self):
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), self.FLUSH_WINDOW))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                # insert_many fills in the _id of every document it writes
+                await self.collection.insert_many([doc for doc, _ in batch])
+            except Exception as exc:
+                for _, future in batch:
+                    future.set_exception(exc)
+            else:
+                for doc, future in batch:
+                    future.set_result(doc["_id"])
+
+
+event_batcher = InsertBatcher(db.events)
+attendee_batcher = InsertBatcher(db.attendees)
+booking_batcher = InsertBatcher(db.bookings)
+
+
+@app.on_event("startup")
+async def start_insert_batchers():
+    for batcher in (event_batcher, attendee_batcher, booking_batcher):
+        asyncio.create_task(batcher.run())
+
 # CRUD ENDPOINTS (Events, Attendees, Venues, Bookings)
 
 
@@ -83,20 +321,21 @@ class Booking(BaseModel):
 @app.post("/events")
 async def create_event(event: Event):
     """Creates a new event document in the database"""
-    event_doc = event.dict()
-    result = await db.events.insert_one(event_doc)
-    return {"message": "Event created", "id": str(result.inserted_id)}
+    inserted_id = await event_batcher.insert(event.model_dump())
+    return {"message": "Event created", "id": str(inserted_id)}
 
 
 #(GET)
 
 @app.get("/events")
 async def get_events():
-    """Retrieves up to 100 events from the database"""
-    events = await db.events.find().to_list(100)
-    for event in events:
-        event["_id"] = str(event["_id"])
-    return events
+    """Streams up to 100 events from the database as a JSON array"""
+    cursor = await db.events.aggregate([
+        {"$limit": 100},
+        {"$project": {"_id": {"$toString": "$_id"}, "name": 1, "date": 1,
+                      "venue_id": 1, "max_attendees": 1}}
+    ], batchSize=100)
+    return stream_docs(cursor)
 
 
 #(PUT)
@@ -104,7 +343,7 @@ async def get_events():
 @app.put("/events/{event_id}")
 async def update_event(event_id: str, event: Event):
     """Updates an existing event using its unique MongoDB ID"""
-    result = await db.events.update_one({"_id": ObjectId(event_id)}, {"$set": event.dict()})
+    result = await db.events.update_one({"_id": oid(event_id)}, {"$set": event.model_dump()})
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Event not found")
     return {"message": "Event updated successfully"}
@@ -115,12 +354,25 @@ async def update_event(event_id: str, event: Event):
 @app.delete("/events/{event_id}")
 async def delete_event(event_id: str):
     """Removes an event from the database"""
-    result = await db.events.delete_one({"_id": ObjectId(event_id)})
+    result = await db.events.delete_one({"_id": oid(event_id)})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Event not found")
     return {"message": "Event deleted successfully"}
 
 
+#(POST batch)
+
+@app.post("/events/batch")
+async def batch_events(ids: list[str]):
+    """Fetches many events by ID in a single round trip - one \\$in query
+    instead of one find_one per ID"""
+    oids = [oid(i) for i in ids]
+    cursor = db.events.find({"_id": {"$in": oids}},
+                            {"name": 1, "description": 1, "date": 1,
+                             "venue_id": 1, "max_attendees": 1})
+    return [encode_event(d) async for d in cursor]
+
+
 
 # --- ATTENDEE EndPoints ---
 
@@ -128,24 +380,26 @@ async def delete_event(event_id: str):
 
 @app.post("/attendees")
 async def create_attendee(attendee: Attendee):
-    result = await db.attendees.insert_one(attendee.dict())
-    return {"message": "Attendee created", "id": str(result.inserted_id)}
+    inserted_id = await attendee_batcher.insert(attendee.model_dump())
+    return {"message": "Attendee created", "id": str(inserted_id)}
 
 
 #(GET)
 
 @app.get("/attendees")
 async def get_attendees():
-    attendees = await db.attendees.find().to_list(100)
-    for a in attendees: a["_id"] = str(a["_id"])
-    return attendees
+    cursor = await db.attendees.aggregate([
+        {"$limit": 100},
+        {"$project": {"_id": {"$toString": "$_id"}, "name": 1, "email": 1, "phone": 1}}
+    ], batchSize=100)
+    return stream_docs(cursor)
 
 
 #(PUT)
 
 @app.put("/attendees/{id}")
 async def update_attendee(id: str, data: Attendee):
-    result = await db.attendees.update_one({"_id": ObjectId(id)}, {"$set": data.dict()})
+    result = await db.attendees.update_one({"_id": oid(id)}, {"$set": data.model_dump()})
     if result.matched_count == 0: raise HTTPException(status_code=404, detail="Not found")
     return {"message": "Attendee updated"}
 
@@ -154,16 +408,25 @@ async def update_attendee(id: str, data: Attendee):
 
 @app.delete("/attendees/{id}")
 async def delete_attendee(id: str):
-    result = await db.attendees.delete_one({"_id": ObjectId(id)})
+    result = await db.attendees.delete_one({"_id": oid(id)})
     return {"message": "Attendee deleted"}
 
+
+#(POST batch)
+
+@app.post("/attendees/batch")
+async def batch_attendees(ids: list[str]):
+    oids = [oid(i) for i in ids]
+    cursor = db.attendees.find({"_id": {"$in": oids}}, {"name": 1, "email": 1, "phone": 1})
+    return [encode_attendee(d) async for d in cursor]
+
 # --- VENUE EndPoints ---
 
 #(POST)
 
 @app.post("/venues")
 async def create_venue(venue: Venue):
-    result = await db.venues.insert_one(venue.dict())
+    result = await db.venues.insert_one(venue.model_dump())
     return {"message": "Venue created", "id": str(result.inserted_id)}
 
 
@@ -171,16 +434,18 @@ async def create_venue(venue: Venue):
 
 @app.get("/venues")
 async def get_venues():
-    venues = await db.venues.find().to_list(100)
-    for v in venues: v["_id"] = str(v["_id"])
-    return venues
+    cursor = await db.venues.aggregate([
+        {"$limit": 100},
+        {"$project": {"_id": {"$toString": "$_id"}, "name": 1, "address": 1, "capacity": 1}}
+    ], batchSize=100)
+    return stream_docs(cursor)
 
 
 #(PUT)
 
 @app.put("/venues/{id}")
 async def update_venue(id: str, data: Venue):
-    result = await db.venues.update_one({"_id": ObjectId(id)}, {"$set": data.dict()})
+    result = await db.venues.update_one({"_id": oid(id)}, {"$set": data.model_dump()})
     return {"message": "Venue updated"}
 
 
@@ -188,33 +453,45 @@ async def update_venue(id: str, data: Venue):
 
 @app.delete("/venues/{id}")
 async def delete_venue(id: str):
-    await db.venues.delete_one({"_id": ObjectId(id)})
+    await db.venues.delete_one({"_id": oid(id)})
     return {"message": "Venue deleted"}
 
+
+#(POST batch)
+
+@app.post("/venues/batch")
+async def batch_venues(ids: list[str]):
+    oids = [oid(i) for i in ids]
+    cursor = db.venues.find({"_id": {"$in": oids}}, {"name": 1, "address": 1, "capacity": 1})
+    return [encode_venue(d) async for d in cursor]
+
 # --- BOOKING EndPoints ---
 
 #(POST)
 
 @app.post("/bookings")
 async def create_booking(booking: Booking):
-    result = await db.bookings.insert_one(booking.dict())
-    return {"message": "Booking successful", "id": str(result.inserted_id)}
+    inserted_id = await booking_batcher.insert(booking.model_dump())
+    return {"message": "Booking successful", "id": str(inserted_id)}
 
 
 #(GET)
 
 @app.get("/bookings")
 async def get_bookings():
-    bookings = await db.bookings.find().to_list(100)
-    for b in bookings: b["_id"] = str(b["_id"])
-    return bookings
+    cursor = await db.bookings.aggregate([
+        {"$limit": 100},
+        {"$project": {"_id": {"$toString": "$_id"}, "event_id": 1, "attendee_id": 1,
+                      "ticket_type": 1, "quantity": 1}}
+    ], batchSize=100)
+    return stream_docs(cursor)
 
 
 #(PUT)
 
 @app.put("/bookings/{id}")
 async def update_booking(id: str, data: Booking):
-    result = await db.bookings.update_one({"_id": ObjectId(id)}, {"$set": data.dict()})
+    result = await db.bookings.update_one({"_id": oid(id)}, {"$set": data.model_dump()})
     return {"message": "Booking updated"}
 
 
@@ -222,150 +499,89 @@ async def update_booking(id: str, data: Booking):
 
 @app.delete("/bookings/{id}")
 async def delete_booking(id: str):
-    await db.bookings.delete_one({"_id": ObjectId(id)})
+    await db.bookings.delete_one({"_id": oid(id)})
     return {"message": "Booking deleted"}
 
+
+#(POST batch)
+
+@app.post("/bookings/batch")
+async def batch_bookings(ids: list[str]):
+    oids = [oid(i) for i in ids]
+    cursor = db.bookings.find({"_id": {"$in": oids}},
+                              {"event_id": 1, "attendee_id": 1, "ticket_type": 1, "quantity": 1})
+    return [encode_booking(d) async for d in cursor]
+
 # --- MULTIMEDIA EndPoints (Event POSTERS,Promo VIDEOS,Venue PHOTOS) ---
 
 # EVENT POSTERS (Images)
 @app.post("/upload_event_poster/{event_id}")
 async def upload_event_poster(event_id: str, file: UploadFile = File(...)):
-    """Reads image file and saves it as binary data associated with an Event ID"""
-    content = await file.read()
-    poster_doc = {
+    """Streams an image file into GridFS in chunks, associated with an Event ID"""
+    file_id = await stream_upload(poster_fs, file, {
         "event_id": event_id,
-        "filename": file.filename,
         "content_type": file.content_type,
-        "content": content,
-        "uploaded_at": datetime.utcnow()
-    }
-    result = await db.event_posters.insert_one(poster_doc)
-    return {"message": "Event poster uploaded", "id": str(result.inserted_id)}
+        "uploaded_at_ns": time.time_ns()
+    })
+    return {"message": "Event poster uploaded", "id": str(file_id)}
 
 @app.get("/get_poster/{event_id}")
-async def get_poster(event_id: str):
-    """Retrieves binary image data and streams it back to the client as a viewable image"""
-    poster = await db.event_posters.find_one({"event_id": event_id})
-    if not poster: raise HTTPException(status_code=404, detail="File not found")
-    return StreamingResponse(io.BytesIO(poster["content"]), media_type=poster["content_type"])
+async def get_poster(event_id: str, request: Request):
+    """Streams the poster image back to the client straight from GridFS"""
+    response = await stream_download(poster_fs, db["event_posters.files"],
+                                     {"metadata.event_id": event_id}, request)
+    if not response: raise HTTPException(status_code=404, detail="File not found")
+    return response
+
+@app.head("/get_poster/{event_id}")
+async def head_poster(event_id: str):
+    """Returns just the poster's headers so clients can validate their cache"""
+    response = await head_file(db["event_posters.files"], {"metadata.event_id": event_id})
+    if not response: raise HTTPException(status_code=404, detail="File not found")
+    return response
 
 # PROMOTIONAL VIDEOS
 @app.post("/upload_promo_video/{event_id}")
 async def upload_promo_video(event_id: str, file: UploadFile = File(...)):
-    content = await file.read()
-    video_doc = {
-        "event_id": event_id, "filename": file.filename,
-        "content_type": file.content_type, "content": content,
-        "uploaded_at": datetime.utcnow()
-    }
-    result = await db.promo_videos.insert_one(video_doc)
-    return {"message": "Promotional video uploaded", "id": str(result.inserted_id)}
-
-@app.get("/get_promo_video/{event_id}")
-async def get_promo_video(event_id: str):
-    video = await db.promo_videos.find_one({"event_id": event_id})
-    if not video: raise HTTPException(status_code=404, detail="Video not found")
-    return StreamingResponse(io.BytesIO(video["content"]), media_type=video["content_type"])
-
-# VENUE PHOTOS
-@app.post("/upload_venue_photo/{venue_id}")
-async def upload_venue_photo(venue_id: str, file: UploadFile = File(...)):
-    content = await file.read()
-    photo_doc = {
-        "venue_id": venue_id, "filename": file.filename,
-        "content_type": file.content_type, "content": content,
-        "uploaded_at": datetime.utcnow()
-    }
-    result = await db.venue_photos.insert_one(photo_doc)
-    return {"message": "Venue photo uploaded", "id": str(result.inserted_id)}
-
-@app.get("/get_venue_photo/{venue_id}")
-async def get_venue_photo(venue_id: str):
-    photo = await db.venue_photos.find_one({"venue_id": venue_id})
-    if not photo: raise HTTPException(status_code=404, detail="Photo not found")
-    return StreamingResponse(io.BytesIO(photo["content"]), media_type=photo["content_type"])
-
-@app.post("/upload_event_poster/{event_id}")
-async def upload_event_poster(event_id: str, file: UploadFile = File(...)):
- content = await file.read()
- poster_doc = {
- "event_id": event_id,
- "filename": file.filename,
- "content_type": file.content_type,
- "content": content,
- "uploaded_at": datetime.utcnow()
- }
- result = await db.event_posters.insert_one(poster_doc)
- return {"message": "Event poster uploaded", "id": str(result.inserted_id)}
-
-@app.get("/get_poster/{event_id}")
-async def get_poster(event_id: str):
-    # Find the data using Motor
-    poster = await db.event_posters.find_one({"event_id": event_id})
-    
-    if not poster:
-        raise HTTPException(status_code=404, detail="File not found")
-
-    # Use 'io' to wrap the 'content' bytes from your list
-    # Use 'StreamingResponse' from your list to send it to the client
-    return StreamingResponse(io.BytesIO(poster["content"]), media_type=poster["content_type"])
-
-#   POST Promo Videos
-@app.post("/upload_promo_video/{event_id}")
-async def upload_promo_video(event_id: str, file: UploadFile = File(...)):
-    content = await file.read()
-    video_doc = {
+    file_id = await stream_upload(video_fs, file, {
         "event_id": event_id,
-        "filename": file.filename,
         "content_type": file.content_type,
-        "content": content,
-        "uploaded_at": datetime.utcnow()
-    }
-    result = await db.promo_videos.insert_one(video_doc)
-    return {"message": "Promotional video uploaded", "id": str(result.inserted_id)}
+        "uploaded_at_ns": time.time_ns()
+    })
+    return {"message": "Promotional video uploaded", "id": str(file_id)}
 
-#   GET Promo Videos
 @app.get("/get_promo_video/{event_id}")
-async def get_promo_video(event_id: str):
-    # Find the video document in the 'promo_videos' collection
-    video = await db.promo_videos.find_one({"event_id": event_id})
-    
-    if not video:
-        raise HTTPException(status_code=404, detail="Promotional video not found")
-    
-    # Return the binary content as a stream so it plays in the browser/Postman
-    return StreamingResponse(
-        io.BytesIO(video["content"]), 
-        media_type=video["content_type"]
-    )
-
-#   POST Venue Photos
+async def get_promo_video(event_id: str, request: Request):
+    response = await stream_download(video_fs, db["promo_videos.files"],
+                                     {"metadata.event_id": event_id}, request)
+    if not response: raise HTTPException(status_code=404, detail="Video not found")
+    return response
+
+@app.head("/get_promo_video/{event_id}")
+async def head_promo_video(event_id: str):
+    response = await head_file(db["promo_videos.files"], {"metadata.event_id": event_id})
+    if not response: raise HTTPException(status_code=404, detail="Video not found")
+    return response
+
+# VENUE PHOTOS
 @app.post("/upload_venue_photo/{venue_id}")
 async def upload_venue_photo(venue_id: str, file: UploadFile = File(...)):
-    content = await file.read()
-    photo_doc = {
+    file_id = await stream_upload(photo_fs, file, {
         "venue_id": venue_id,
-        "filename": file.filename,
         "content_type": file.content_type,
-        "content": content,
-        "uploaded_at": datetime.utcnow()
-    }
-    result = await db.venue_photos.insert_one(photo_doc)
-    return {"message": "Venue photo uploaded", "id": str(result.inserted_id)}
-
-
+        "uploaded_at_ns": time.time_ns()
+    })
+    return {"message": "Venue photo uploaded", "id": str(file_id)}
 
-#  GET Venue Photos 
 @app.get("/get_venue_photo/{venue_id}")
-async def get_venue_photo(venue_id: str):
-    # Find the photo document in the 'venue_photos' collection
-    photo = await db.venue_photos.find_one({"venue_id": venue_id})
-    
-    if not photo:
-        raise HTTPException(status_code=404, detail="Venue photo not found")
-    
-    # Return the binary content as an image stream
-    return StreamingResponse(
-        io.BytesIO(photo["content"]), 
-        media_type=photo["content_type"]
-    )
\ No newline at end of file
+async def get_venue_photo(venue_id: str, request: Request):
+    response = await stream_download(photo_fs, db["venue_photos.files"],
+                                     {"metadata.venue_id": venue_id}, request)
+    if not response: raise HTTPException(status_code=404, detail="Photo not found")
+    return response
+
+@app.head("/get_venue_photo/{venue_id}")
+async def head_venue_photo(venue_id: str):
+    response = await head_file(db["venue_photos.files"], {"metadata.venue_id": venue_id})
+    if not response: raise HTTPException(status_code=404, detail="Photo not found")
+    return response